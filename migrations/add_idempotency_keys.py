@@ -0,0 +1,54 @@
+"""
+Migration: Store Idempotency-Key claims and responses so order retries are safe across workers
+Run with: ./venv/bin/python migrations/add_idempotency_keys.py
+"""
+import mysql.connector
+import os
+
+DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "11111111")
+DB_NAME = os.getenv("DB_NAME", "cafe_ca3")
+
+try:
+    cnx = mysql.connector.connect(
+        host=DB_HOST, user=DB_USER, password=DB_PASSWORD,
+        database=DB_NAME, auth_plugin='mysql_native_password'
+    )
+    cur = cnx.cursor()
+
+    print("Creating idempotency_keys table...")
+
+    try:
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS idempotency_keys (
+                scope VARCHAR(100) NOT NULL,
+                idem_key VARCHAR(255) NOT NULL,
+                request_hash CHAR(64) NOT NULL,
+                response_status SMALLINT NULL,
+                response_body MEDIUMTEXT NULL,
+                response_mimetype VARCHAR(100) NULL,
+                order_id INT NULL,
+                created_at DATETIME NOT NULL,
+                expires_at DATETIME NOT NULL,
+                PRIMARY KEY (scope, idem_key),
+                INDEX idx_idempotency_keys_expires_at (expires_at)
+            )
+        """)
+        print("✓ Created idempotency_keys")
+    except Exception as e:
+        print(f"ℹ idempotency_keys: {e}")
+
+    try:
+        cur.execute("DELETE FROM idempotency_keys WHERE expires_at < NOW()")
+        print(f"✓ Purged {cur.rowcount} expired keys")
+    except Exception as e:
+        print(f"ℹ purge skipped: {e}")
+
+    cnx.commit()
+    cur.close()
+    cnx.close()
+    print("\n✅ Migration complete!")
+
+except Exception as e:
+    print(f"❌ Error: {e}")
@@ -0,0 +1,45 @@
+"""
+Migration: Add the inventory_movements ledger (stock changes queued by orders, applied in the background)
+Run with: ./venv/bin/python migrations/add_inventory_ledger.py
+"""
+import mysql.connector
+import os
+
+DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "11111111")
+DB_NAME = os.getenv("DB_NAME", "cafe_ca3")
+
+try:
+    cnx = mysql.connector.connect(
+        host=DB_HOST, user=DB_USER, password=DB_PASSWORD,
+        database=DB_NAME, auth_plugin='mysql_native_password'
+    )
+    cur = cnx.cursor()
+
+    print("Creating inventory_movements table...")
+
+    try:
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS inventory_movements (
+                id BIGINT AUTO_INCREMENT PRIMARY KEY,
+                item_id INT NOT NULL,
+                delta INT NOT NULL,
+                order_id INT NULL,
+                reason VARCHAR(32) NOT NULL DEFAULT 'order',
+                created_at DATETIME NOT NULL,
+                applied_at DATETIME NULL,
+                INDEX idx_inventory_movements_applied_at_id (applied_at, id)
+            )
+        """)
+        print("✓ Created inventory_movements")
+    except Exception as e:
+        print(f"ℹ inventory_movements: {e}")
+
+    cnx.commit()
+    cur.close()
+    cnx.close()
+    print("\n✅ Migration complete!")
+
+except Exception as e:
+    print(f"❌ Error: {e}")
@@ -0,0 +1,46 @@
+"""
+Migration: Covering indexes for the single-pass KPI queries
+Run with: ./venv/bin/python migrations/add_kpi_indexes.py
+
+/api/kpis/receptionist reads (order_time, status) and /api/kpis/chef reads
+(prep_end, item_status, prep_start, order_id), so both become index-only range scans.
+The orders index also carries total_amount, which keeps the revenue sums over an
+order_time window (kpis_manager, revenue range) index-only; it is the only
+order_time index the KPI queries need.
+"""
+import mysql.connector
+import os
+
+DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "11111111")
+DB_NAME = os.getenv("DB_NAME", "cafe_ca3")
+
+INDEXES = [
+    ("orders", "idx_orders_order_time_status_amount", "(order_time, status, total_amount)"),
+    ("order_items", "idx_order_items_prep_end_status", "(prep_end, item_status, prep_start, order_id)"),
+]
+
+try:
+    cnx = mysql.connector.connect(
+        host=DB_HOST, user=DB_USER, password=DB_PASSWORD,
+        database=DB_NAME, auth_plugin='mysql_native_password'
+    )
+    cur = cnx.cursor()
+
+    print("Adding KPI indexes...")
+
+    for table, name, cols in INDEXES:
+        try:
+            cur.execute(f"ALTER TABLE {table} ADD INDEX {name} {cols}")
+            print(f"✓ Added {name}")
+        except:
+            print(f"ℹ {name} exists")
+
+    cnx.commit()
+    cur.close()
+    cnx.close()
+    print("\n✅ Migration complete!")
+
+except Exception as e:
+    print(f"❌ Error: {e}")
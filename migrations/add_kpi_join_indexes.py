@@ -0,0 +1,44 @@
+"""
+Migration: Covering index for the kpis_manager raw-window join
+Run with: ./venv/bin/python migrations/add_kpi_join_indexes.py
+
+The category breakdown ranges over orders.order_time (covered by
+idx_orders_order_time_status_amount from add_kpi_indexes.py) and joins
+order_items on order_id; with this index neither side has to touch the table rows.
+Verify afterwards with: ./venv/bin/python scripts/check_query_plans.py
+"""
+import mysql.connector
+import os
+
+DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "11111111")
+DB_NAME = os.getenv("DB_NAME", "cafe_ca3")
+
+INDEXES = [
+    ("order_items", "idx_order_items_order_item_price", "(order_id, item_id, qty, price)"),
+]
+
+try:
+    cnx = mysql.connector.connect(
+        host=DB_HOST, user=DB_USER, password=DB_PASSWORD,
+        database=DB_NAME, auth_plugin='mysql_native_password'
+    )
+    cur = cnx.cursor()
+
+    print("Adding KPI join index...")
+
+    for table, name, cols in INDEXES:
+        try:
+            cur.execute(f"ALTER TABLE {table} ADD INDEX {name} {cols}")
+            print(f"✓ Added {name}")
+        except:
+            print(f"ℹ {name} exists")
+
+    cnx.commit()
+    cur.close()
+    cnx.close()
+    print("\n✅ Migration complete!")
+
+except Exception as e:
+    print(f"❌ Error: {e}")
@@ -0,0 +1,63 @@
+"""
+Migration: Rollup tables for KPI endpoints (daily_metrics extras, daily_category_metrics, item_sales_totals)
+Run with: ./venv/bin/python migrations/add_metrics_rollups.py
+
+daily_metrics itself is created by upgrade_schema.py; run that first.
+Order writes keep the rollups current from then on; load history once with:
+flask --app app backfill-metrics
+"""
+import mysql.connector
+import os
+
+DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "11111111")
+DB_NAME = os.getenv("DB_NAME", "cafe_ca3")
+
+try:
+    cnx = mysql.connector.connect(
+        host=DB_HOST, user=DB_USER, password=DB_PASSWORD,
+        database=DB_NAME, auth_plugin='mysql_native_password'
+    )
+    cur = cnx.cursor()
+
+    print("Extending daily_metrics...")
+
+    try:
+        cur.execute("""
+            ALTER TABLE daily_metrics ADD COLUMN updated_at TIMESTAMP
+            DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        """)
+        print("✓ Added updated_at")
+    except:
+        print("ℹ updated_at exists")
+
+    print("Creating daily_category_metrics table...")
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS daily_category_metrics (
+            metric_date DATE NOT NULL,
+            category VARCHAR(100) NOT NULL,
+            order_lines INT NOT NULL DEFAULT 0,
+            revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+            PRIMARY KEY (metric_date, category)
+        )
+    """)
+    print("✓ daily_category_metrics ready")
+
+    print("Creating item_sales_totals table...")
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS item_sales_totals (
+            item_id INT NOT NULL PRIMARY KEY,
+            qty BIGINT NOT NULL DEFAULT 0,
+            KEY idx_item_sales_totals_qty (qty)
+        )
+    """)
+    print("✓ item_sales_totals ready")
+
+    cnx.commit()
+    cur.close()
+    cnx.close()
+    print("\n✅ Migration complete! Load history with: flask --app app backfill-metrics")
+
+except Exception as e:
+    print(f"❌ Error: {e}")
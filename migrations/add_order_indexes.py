@@ -0,0 +1,44 @@
+"""
+Migration: Composite indexes backing keyset pagination and filters on /api/orders
+Run with: ./venv/bin/python migrations/add_order_indexes.py
+"""
+import mysql.connector
+import os
+
+DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "11111111")
+DB_NAME = os.getenv("DB_NAME", "cafe_ca3")
+
+# Every index ends in (created_at, id) so a filtered page is a single range scan
+# in ORDER BY created_at DESC, id DESC order, no matter how deep the page is.
+INDEXES = [
+    ("idx_orders_created_id", "(created_at, id)"),
+    ("idx_orders_status_created_id", "(status, created_at, id)"),
+    ("idx_orders_type_created_id", "(type, created_at, id)"),
+    ("idx_orders_priority_created_id", "(priority, created_at, id)"),
+]
+
+try:
+    cnx = mysql.connector.connect(
+        host=DB_HOST, user=DB_USER, password=DB_PASSWORD,
+        database=DB_NAME, auth_plugin='mysql_native_password'
+    )
+    cur = cnx.cursor()
+
+    print("Adding order list indexes...")
+
+    for name, cols in INDEXES:
+        try:
+            cur.execute(f"ALTER TABLE orders ADD INDEX {name} {cols}")
+            print(f"✓ Added {name}")
+        except:
+            print(f"ℹ {name} exists")
+
+    cnx.commit()
+    cur.close()
+    cnx.close()
+    print("\n✅ Migration complete!")
+
+except Exception as e:
+    print(f"❌ Error: {e}")
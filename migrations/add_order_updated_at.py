@@ -0,0 +1,43 @@
+"""
+Migration: Track when each order last changed (powers the /api/orders/changes delta feed)
+Run with: ./venv/bin/python migrations/add_order_updated_at.py
+"""
+import mysql.connector
+import os
+
+DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "11111111")
+DB_NAME = os.getenv("DB_NAME", "cafe_ca3")
+
+try:
+    cnx = mysql.connector.connect(
+        host=DB_HOST, user=DB_USER, password=DB_PASSWORD,
+        database=DB_NAME, auth_plugin='mysql_native_password'
+    )
+    cur = cnx.cursor()
+
+    print("Adding updated_at to orders table...")
+
+    try:
+        cur.execute("""
+            ALTER TABLE orders ADD COLUMN updated_at TIMESTAMP(6) NOT NULL
+            DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6)
+        """)
+        print("✓ Added updated_at")
+    except:
+        print("ℹ updated_at exists")
+
+    try:
+        cur.execute("ALTER TABLE orders ADD INDEX idx_orders_updated_at_id (updated_at, id)")
+        print("✓ Added idx_orders_updated_at_id")
+    except:
+        print("ℹ idx_orders_updated_at_id exists")
+
+    cnx.commit()
+    cur.close()
+    cnx.close()
+    print("\n✅ Migration complete!")
+
+except Exception as e:
+    print(f"❌ Error: {e}")
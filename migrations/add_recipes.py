@@ -0,0 +1,63 @@
+"""
+Migration: Add recipes (menu item -> ingredient quantities) and the ingredient_movements ledger
+Requires the ingredients table from migrations/upgrade_schema.py.
+Run with: ./venv/bin/python migrations/add_recipes.py
+"""
+import mysql.connector
+import os
+
+DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "11111111")
+DB_NAME = os.getenv("DB_NAME", "cafe_ca3")
+
+try:
+    cnx = mysql.connector.connect(
+        host=DB_HOST, user=DB_USER, password=DB_PASSWORD,
+        database=DB_NAME, auth_plugin='mysql_native_password'
+    )
+    cur = cnx.cursor()
+
+    print("Creating recipes table...")
+
+    try:
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS recipes (
+                item_id INT NOT NULL,
+                ingredient_id INT NOT NULL,
+                qty DECIMAL(10, 3) NOT NULL,
+                updated_at DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+                PRIMARY KEY (item_id, ingredient_id),
+                FOREIGN KEY (ingredient_id) REFERENCES ingredients(id)
+            )
+        """)
+        print("✓ Created recipes")
+    except Exception as e:
+        print(f"ℹ recipes: {e}")
+
+    print("Creating ingredient_movements table...")
+
+    try:
+        cur.execute("""
+            CREATE TABLE IF NOT EXISTS ingredient_movements (
+                id BIGINT AUTO_INCREMENT PRIMARY KEY,
+                ingredient_id INT NOT NULL,
+                delta DECIMAL(12, 3) NOT NULL,
+                order_id INT NULL,
+                reason VARCHAR(32) NOT NULL DEFAULT 'order',
+                created_at DATETIME NOT NULL,
+                applied_at DATETIME NULL,
+                INDEX idx_ingredient_movements_applied_at_id (applied_at, id)
+            )
+        """)
+        print("✓ Created ingredient_movements")
+    except Exception as e:
+        print(f"ℹ ingredient_movements: {e}")
+
+    cnx.commit()
+    cur.close()
+    cnx.close()
+    print("\n✅ Migration complete!")
+
+except Exception as e:
+    print(f"❌ Error: {e}")
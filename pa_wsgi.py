@@ -9,6 +9,16 @@ Notes:
 - If you need Socket.IO support, additional configuration is required on the server.
 """
 import os
+
+# Green-thread mode must patch the stdlib before anything else imports it
+ASYNC_MODE = os.getenv('ASYNC_MODE', 'threading')
+if ASYNC_MODE == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+elif ASYNC_MODE == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+
 import sys
 from dotenv import load_dotenv
 
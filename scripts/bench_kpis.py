@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark: latency of the /api/kpis/* endpoints against a large order history
+
+Seeds a scratch database (default <DB_NAME>_kpi_bench) with 1M orders spread
+over the last 90 days plus their order_items, then calls each KPI endpoint
+through the Flask test client and reports p50/p99 per endpoint. The KPI
+cache is cleared before every request unless --cached is given.
+Table definitions are copied from DB_NAME; real data is never touched.
+
+Run with: ./venv/bin/python scripts/bench_kpis.py [--orders 1000000] [--requests 50]
+Re-run against the seeded data with --reuse; drop it with --drop.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+import mysql.connector
+
+DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "11111111")
+DB_NAME = os.getenv("DB_NAME", "cafe_ca3")
+
+TABLES = ("items", "orders", "order_items", "daily_metrics", "daily_category_metrics", "item_sales_totals")
+BATCH = 5000
+HISTORY_DAYS = 90
+
+ORDER_STATUSES = (('completed', 70), ('served', 12), ('cancelled', 5), ('queued', 8), ('preparing', 5))
+ITEM_STATUSES = {'completed': 'served', 'served': 'served', 'cancelled': 'queued',
+                 'queued': 'queued', 'preparing': 'preparing'}
+
+ENDPOINTS = [
+    ('kpis_receptionist', '/api/kpis/receptionist?range_hours=24'),
+    ('kpis_chief', '/api/kpis/chef?range_hours=24'),
+    ('kpis_manager', '/api/kpis/manager?range_days=30'),
+]
+
+
+def connect(database):
+    return mysql.connector.connect(
+        host=DB_HOST, user=DB_USER, password=DB_PASSWORD,
+        database=database, auth_plugin='mysql_native_password'
+    )
+
+
+def create_scratch(cnx, bench_db):
+    cur = cnx.cursor()
+    cur.execute(f"DROP DATABASE IF EXISTS `{bench_db}`")
+    cur.execute(f"CREATE DATABASE `{bench_db}`")
+    for table in TABLES:
+        try:
+            cur.execute(f"CREATE TABLE `{bench_db}`.{table} LIKE `{DB_NAME}`.{table}")
+        except mysql.connector.Error as e:
+            print(f"ℹ skipping {table}: {e.msg}")
+    cur.execute(f"INSERT INTO `{bench_db}`.items SELECT * FROM `{DB_NAME}`.items")
+    cnx.commit()
+    cur.close()
+
+
+def seed(cnx, n_orders):
+    cur = cnx.cursor()
+    cur.execute("SELECT id, price FROM items")
+    items = [(row[0], float(row[1])) for row in cur.fetchall()]
+    if not items:
+        sys.exit(f"❌ {DB_NAME}.items is empty; seed the menu first")
+
+    statuses = [s for s, _ in ORDER_STATUSES]
+    weights = [w for _, w in ORDER_STATUSES]
+    now = datetime.now()
+    span = HISTORY_DAYS * 86400
+    rng = random.Random(42)
+
+    t0 = time.perf_counter()
+    for start in range(1, n_orders + 1, BATCH):
+        orders, order_items = [], []
+        for order_id in range(start, min(start + BATCH, n_orders + 1)):
+            order_time = now - timedelta(seconds=rng.randrange(span))
+            status = rng.choices(statuses, weights)[0]
+            total = 0.0
+            for item_id, price in rng.sample(items, min(len(items), rng.randint(1, 4))):
+                qty = rng.randint(1, 3)
+                total += price * qty
+                prep_start = prep_end = None
+                if status in ('completed', 'served'):
+                    prep_start = order_time + timedelta(minutes=rng.randint(0, 5))
+                    prep_end = prep_start + timedelta(minutes=rng.randint(3, 35))
+                order_items.append((order_id, item_id, qty, price, json.dumps([]),
+                                    ITEM_STATUSES[status], prep_start, prep_end))
+            orders.append((order_id, order_time, order_time, round(total, 2), 'bench', status))
+        cur.executemany(
+            "INSERT INTO orders (id, order_time, created_at, total_amount, cashier, status) "
+            "VALUES (%s, %s, %s, %s, %s, %s)", orders)
+        cur.executemany(
+            "INSERT INTO order_items (order_id, item_id, qty, price, modifiers, item_status, prep_start, prep_end) "
+            "VALUES (%s, %s, %s, %s, %s, %s, %s, %s)", order_items)
+        cnx.commit()
+        done = min(start + BATCH - 1, n_orders)
+        print(f"\r  seeded {done:,}/{n_orders:,} orders", end='', flush=True)
+    cur.execute("ANALYZE TABLE orders, order_items")
+    cur.fetchall()
+    cur.close()
+    print(f"\n  seeding took {time.perf_counter() - t0:.0f}s")
+
+
+def bench(bench_db, n_requests, cached, backfill):
+    # app reads DB_NAME at import; load_dotenv() never overrides it
+    os.environ['DB_NAME'] = bench_db
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    from app import app, kpi_cache
+
+    if backfill:
+        # seeded rows bypass the order write path, so the KPI rollups start empty
+        result = app.test_cli_runner().invoke(args=['backfill-metrics'])
+        print(result.output.strip().splitlines()[-1] if result.output.strip() else result.exception)
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_id'] = 0
+        sess['username'] = 'bench'
+        sess['role'] = 'manager'
+
+    print(f"{'endpoint':<18} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for name, url in ENDPOINTS:
+        client.get(url)  # warm the pool
+        timings = []
+        for _ in range(n_requests):
+            if not cached:
+                kpi_cache.invalidate(name)
+            t0 = time.perf_counter()
+            resp = client.get(url)
+            timings.append((time.perf_counter() - t0) * 1000)
+            if resp.status_code != 200:
+                sys.exit(f"❌ {url} returned {resp.status_code}: {resp.get_data(as_text=True)[:200]}")
+        timings.sort()
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        print(f"{name:<18} {statistics.median(timings):>8.2f} {p99:>8.2f} {timings[-1]:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--orders', type=int, default=1_000_000, help='orders to seed')
+    parser.add_argument('--requests', type=int, default=50, help='timed requests per endpoint')
+    parser.add_argument('--database', default=f"{DB_NAME}_kpi_bench", help='scratch database name')
+    parser.add_argument('--reuse', action='store_true', help='skip seeding and reuse the scratch database')
+    parser.add_argument('--cached', action='store_true', help='measure KPI cache hits instead of the queries')
+    parser.add_argument('--drop', action='store_true', help='drop the scratch database afterwards')
+    args = parser.parse_args()
+
+    if args.database == DB_NAME:
+        sys.exit("❌ --database must not be the application database")
+
+    print("=" * 70)
+    print(f"KPI endpoint benchmark ({args.database})")
+    print("=" * 70)
+    if not args.reuse:
+        cnx = connect(DB_NAME)
+        create_scratch(cnx, args.database)
+        cnx.close()
+        cnx = connect(args.database)
+        seed(cnx, args.orders)
+        cnx.close()
+
+    try:
+        bench(args.database, args.requests, args.cached, backfill=not args.reuse)
+    finally:
+        if args.drop:
+            cnx = connect(DB_NAME)
+            cur = cnx.cursor()
+            cur.execute(f"DROP DATABASE IF EXISTS `{args.database}`")
+            cur.close()
+            cnx.close()
+
+
+if __name__ == '__main__':
+    main()
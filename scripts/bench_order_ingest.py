@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Benchmark: order ingestion throughput, one COMMIT per order vs. group commit
+
+Posts orders to /api/public/orders from concurrent client threads through the
+Flask test client, first with ORDER_GROUP_COMMIT off (each request inserts and
+commits its own order) and then on (the writer batches concurrent orders into
+one transaction), and reports orders/sec, request p50/p99 and batch sizes.
+Runs against a scratch database (default <DB_NAME>_ingest_bench) whose tables
+are copied from DB_NAME; real orders are never touched.
+
+Run with: ./venv/bin/python scripts/bench_order_ingest.py [--clients 32] [--orders 100]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+import mysql.connector
+
+DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "11111111")
+DB_NAME = os.getenv("DB_NAME", "cafe_ca3")
+
+TABLES = ("items", "orders", "order_items")
+
+
+def connect(database):
+    return mysql.connector.connect(
+        host=DB_HOST, user=DB_USER, password=DB_PASSWORD,
+        database=database, auth_plugin='mysql_native_password'
+    )
+
+
+def create_scratch(bench_db):
+    cnx = connect(DB_NAME)
+    cur = cnx.cursor()
+    cur.execute(f"DROP DATABASE IF EXISTS `{bench_db}`")
+    cur.execute(f"CREATE DATABASE `{bench_db}`")
+    for table in TABLES:
+        cur.execute(f"CREATE TABLE `{bench_db}`.{table} LIKE `{DB_NAME}`.{table}")
+    cur.execute(f"INSERT INTO `{bench_db}`.items SELECT * FROM `{DB_NAME}`.items")
+    cur.execute(f"SELECT id FROM `{bench_db}`.items")
+    item_ids = [row[0] for row in cur.fetchall()]
+    cnx.commit()
+    cur.close()
+    cnx.close()
+    if not item_ids:
+        sys.exit(f"❌ {DB_NAME}.items is empty; seed the menu first")
+    return item_ids
+
+
+def drop_scratch(bench_db):
+    cnx = connect(DB_NAME)
+    cur = cnx.cursor()
+    cur.execute(f"DROP DATABASE IF EXISTS `{bench_db}`")
+    cur.close()
+    cnx.close()
+
+
+def run(app, item_ids, n_clients, n_orders):
+    timings, failures = [], []
+    lock = threading.Lock()
+
+    def client_loop(seed):
+        rng = random.Random(seed)
+        client = app.test_client()
+        local = []
+        for _ in range(n_orders):
+            items = [{'item_id': i, 'qty': rng.randint(1, 3)} for i in rng.sample(item_ids, min(3, len(item_ids)))]
+            t0 = time.perf_counter()
+            resp = client.post('/api/public/orders', json={'customer_name': 'bench', 'items': items})
+            local.append((time.perf_counter() - t0) * 1000)
+            if resp.status_code != 201:
+                with lock:
+                    failures.append(resp.get_data(as_text=True)[:200])
+        with lock:
+            timings.extend(local)
+
+    threads = [threading.Thread(target=client_loop, args=(n,)) for n in range(n_clients)]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t0
+
+    if failures:
+        sys.exit(f"❌ {len(failures)} orders failed, e.g. {failures[0]}")
+    timings.sort()
+    return {
+        'orders_per_sec': len(timings) / elapsed,
+        'p50_ms': statistics.median(timings),
+        'p99_ms': timings[min(len(timings) - 1, int(len(timings) * 0.99))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clients', type=int, default=32, help='concurrent client threads')
+    parser.add_argument('--orders', type=int, default=100, help='orders posted by each client per scenario')
+    parser.add_argument('--database', default=f"{DB_NAME}_ingest_bench", help='scratch database name')
+    parser.add_argument('--keep', action='store_true', help='keep the scratch database afterwards')
+    args = parser.parse_args()
+
+    if args.database == DB_NAME:
+        sys.exit("❌ --database must not be the application database")
+
+    print("=" * 70)
+    print(f"Order ingestion benchmark ({args.clients} clients x {args.orders} orders, {args.database})")
+    print("=" * 70)
+    item_ids = create_scratch(args.database)
+
+    # app reads these at import; load_dotenv() never overrides them
+    os.environ['DB_NAME'] = args.database
+    os.environ.setdefault('DB_POOL_MAX_SIZE', str(args.clients + 2))
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    import app as chaa_choo
+
+    try:
+        print(f"{'mode':<14} {'orders/s':>9} {'p50 ms':>8} {'p99 ms':>8}  batches")
+        for name, group_commit in (('per-order', False), ('group-commit', True)):
+            chaa_choo.ORDER_GROUP_COMMIT = group_commit
+            before = chaa_choo.order_writer.stats()
+            r = run(chaa_choo.app, item_ids, args.clients, args.orders)
+            after = chaa_choo.order_writer.stats()
+            batches = after['batches'] - before['batches']
+            detail = '-'
+            if batches:
+                detail = (f"{batches} (avg {(after['orders'] - before['orders']) / batches:.1f}, "
+                          f"max {after['largest_batch']})")
+            print(f"{name:<14} {r['orders_per_sec']:>9.0f} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f}  {detail}")
+    finally:
+        if not args.keep:
+            drop_scratch(args.database)
+
+
+if __name__ == '__main__':
+    main()
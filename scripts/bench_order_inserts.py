@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-row order_items inserts vs. one multi-row insert (executemany)
+
+Writes 1, 10 and 50-item orders into a scratch copy of order_items and reports
+statements sent to the server (Com_insert) and latency per order.
+The scratch table is dropped afterwards; real orders are never touched.
+
+Run with: ./venv/bin/python scripts/bench_order_inserts.py [--orders 200]
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+
+import mysql.connector
+
+DB_HOST = os.getenv("DB_HOST", "127.0.0.1")
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "11111111")
+DB_NAME = os.getenv("DB_NAME", "cafe_ca3")
+
+TABLE = "bench_order_items"
+INSERT = f"INSERT INTO {TABLE} (order_id, item_id, qty, price, modifiers, item_status) VALUES (%s, %s, %s, %s, %s, %s)"
+
+
+def com_insert(cur):
+    cur.execute("SHOW SESSION STATUS LIKE 'Com_insert'")
+    return int(cur.fetchone()[1])
+
+
+def make_rows(order_id, n_items):
+    return [(order_id, 1000 + i, 1 + i % 3, 55.0, json.dumps([]), 'queued') for i in range(n_items)]
+
+
+def per_row(cur, rows):
+    for row in rows:
+        cur.execute(INSERT, row)
+
+
+def batched(cur, rows):
+    cur.executemany(INSERT, rows)
+
+
+def run(cnx, strategy, n_items, n_orders):
+    cur = cnx.cursor()
+    before = com_insert(cur)
+    timings = []
+    for order_id in range(n_orders):
+        rows = make_rows(order_id, n_items)
+        t0 = time.perf_counter()
+        strategy(cur, rows)
+        cnx.commit()
+        timings.append((time.perf_counter() - t0) * 1000)
+    statements = com_insert(cur) - before
+    cur.close()
+    timings.sort()
+    return {
+        'statements_per_order': statements / n_orders,
+        'p50_ms': statistics.median(timings),
+        'p99_ms': timings[min(len(timings) - 1, int(len(timings) * 0.99))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--orders', type=int, default=200, help='orders per scenario')
+    args = parser.parse_args()
+
+    cnx = mysql.connector.connect(
+        host=DB_HOST, user=DB_USER, password=DB_PASSWORD,
+        database=DB_NAME, auth_plugin='mysql_native_password'
+    )
+    cur = cnx.cursor()
+    cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+    cur.execute(f"""
+        CREATE TABLE {TABLE} (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            order_id INT NOT NULL,
+            item_id INT NOT NULL,
+            qty INT NOT NULL,
+            price DECIMAL(10, 2) NOT NULL DEFAULT 0.00,
+            modifiers JSON,
+            item_status VARCHAR(50) DEFAULT 'queued',
+            KEY (order_id)
+        )
+    """)
+    cur.close()
+
+    print("=" * 70)
+    print(f"order_items insert benchmark ({args.orders} orders per scenario)")
+    print("=" * 70)
+    print(f"{'items':>5}  {'strategy':<12} {'stmts/order':>11} {'p50 ms':>8} {'p99 ms':>8}")
+    try:
+        for n_items in (1, 10, 50):
+            for name, strategy in (('per-row', per_row), ('executemany', batched)):
+                r = run(cnx, strategy, n_items, args.orders)
+                print(f"{n_items:>5}  {name:<12} {r['statements_per_order']:>11.1f} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f}")
+    finally:
+        cur = cnx.cursor()
+        cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        cur.close()
+        cnx.close()
+
+
+if __name__ == '__main__':
+    main()
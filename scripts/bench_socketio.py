@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: WebSocket connections held by one worker and broadcast latency
+
+Starts one gunicorn worker in the given ASYNC_MODE, opens --clients Socket.IO
+WebSocket connections that all join the chief dashboard room, then publishes
+--broadcasts events into the room through the file message queue (the same
+path emit_order_update takes from another worker) and reports how many
+sockets the worker held, its OS threads and RSS, and per-delivery latency.
+Latency includes the file queue's poll delay (up to 50 ms). Needs no database.
+
+Needs the asyncio client: pip install "python-socketio[asyncio_client]"
+and, for the green modes, gevent or eventlet.
+Run with: ./venv/bin/python scripts/bench_socketio.py --mode gevent [--clients 1000]
+"""
+import argparse
+import asyncio
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import socketio
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+from app import FileQueueManager, SOCKETIO_CHANNEL  # noqa: E402
+
+PORT = 8093
+ROOM = 'chief'
+CONNECT_BATCH = 100
+
+
+def start_worker(mode, clients, queue_path):
+    if mode == 'threading':
+        # one OS thread per socket, so size the pool for every client
+        worker_args = ['-k', 'gthread', '--threads', str(clients + 50)]
+    else:
+        worker_args = ['-k', mode, '--worker-connections', str(clients + 50)]
+    env = dict(os.environ, ASYNC_MODE=mode, SOCKETIO_MESSAGE_QUEUE='file://' + queue_path, LOG_FILE=os.devnull)
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-w', '1', '--bind', f'127.0.0.1:{PORT}',
+         '--timeout', '120', *worker_args, 'wsgi:app'],
+        cwd=ROOT, env=env, start_new_session=True, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while True:
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{PORT}/api/public/items', timeout=2).read()
+            return proc
+        except Exception:
+            if time.time() > deadline:
+                raise RuntimeError('worker did not come up')
+            time.sleep(0.5)
+
+
+def worker_process_stats(master_pid):
+    """(threads, rss MiB) of the gunicorn worker, read from /proc."""
+    try:
+        children = open(f'/proc/{master_pid}/task/{master_pid}/children').read().split()
+        pid = int(children[0])
+        status = dict(line.split(':', 1) for line in open(f'/proc/{pid}/status') if ':' in line)
+        return int(status['Threads']), int(status['VmRSS'].split()[0]) / 1024
+    except (OSError, IndexError, KeyError, ValueError):
+        return None, None
+
+
+async def open_clients(n):
+    clients, latencies = [], []
+    loop = asyncio.get_running_loop()
+
+    async def one():
+        client = socketio.AsyncClient(reconnection=False)
+        joined = asyncio.Event()
+        client.on('dashboard_joined', lambda data: joined.set())
+        client.on('bench_broadcast', lambda data: latencies.append((data['seq'], time.time() - data['sent'])))
+        await client.connect(f'http://127.0.0.1:{PORT}', transports=['websocket'], wait_timeout=30)
+        await client.emit('join_dashboard', {'dashboard': ROOM})
+        await asyncio.wait_for(joined.wait(), 30)
+        return client
+
+    for start in range(0, n, CONNECT_BATCH):
+        results = await asyncio.gather(*(one() for _ in range(min(CONNECT_BATCH, n - start))), return_exceptions=True)
+        clients.extend(c for c in results if not isinstance(c, Exception))
+    return clients, latencies
+
+
+async def run(args, queue_path, master_pid):
+    clients, latencies = await open_clients(args.clients)
+    publisher = FileQueueManager(queue_path, channel=SOCKETIO_CHANNEL, write_only=True)
+    await asyncio.sleep(1)
+    for seq in range(args.broadcasts):
+        publisher._publish({'method': 'emit', 'event': 'bench_broadcast',
+                            'data': {'seq': seq, 'sent': time.time()},
+                            'namespace': '/', 'room': ROOM, 'skip_sid': None,
+                            'callback': None, 'host_id': 'bench'})
+        await asyncio.sleep(args.interval)
+    await asyncio.sleep(2)
+    held = len(clients)
+    threads, rss = worker_process_stats(master_pid)
+    await asyncio.gather(*(c.disconnect() for c in clients), return_exceptions=True)
+    return held, threads, rss, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--mode', choices=('threading', 'gevent', 'eventlet'), default='gevent')
+    parser.add_argument('--clients', type=int, default=1000, help='concurrent WebSocket clients')
+    parser.add_argument('--broadcasts', type=int, default=20, help='room broadcasts to time')
+    parser.add_argument('--interval', type=float, default=0.5, help='seconds between broadcasts')
+    args = parser.parse_args()
+
+    queue_path = os.path.join(tempfile.mkdtemp(prefix='chaa-sio-bench-'), 'socketio.queue')
+    print("=" * 70)
+    print(f"Socket.IO benchmark: ASYNC_MODE={args.mode}, {args.clients} clients, 1 worker")
+    print("=" * 70)
+
+    proc = start_worker(args.mode, args.clients, queue_path)
+    try:
+        held, threads, rss, latencies = asyncio.run(run(args, queue_path, proc.pid))
+    finally:
+        os.killpg(proc.pid, signal.SIGTERM)
+        proc.wait(timeout=15)
+
+    expected = held * args.broadcasts
+    print(f"connections held:    {held}/{args.clients}")
+    print(f"worker OS threads:   {threads if threads is not None else 'n/a'}")
+    print(f"worker RSS:          {f'{rss:.0f} MiB' if rss is not None else 'n/a'}")
+    print(f"deliveries:          {len(latencies)}/{expected}")
+    if latencies:
+        ms = sorted(l * 1000 for _, l in latencies)
+        per_broadcast = {}
+        for seq, l in latencies:
+            per_broadcast[seq] = max(per_broadcast.get(seq, 0), l * 1000)
+        print(f"delivery p50 / p99:  {statistics.median(ms):.1f} / {ms[min(len(ms) - 1, int(len(ms) * 0.99))]:.1f} ms")
+        print(f"last client (p50):   {statistics.median(per_broadcast.values()):.1f} ms after publish")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Query-plan regression check for the KPI queries
+
+EXPLAINs the SQL that app.py runs for /api/kpis/manager against DB_NAME and
+exits non-zero if any large table (orders, order_items) is read with a full
+table or full index scan, or if a DEPENDENT SUBQUERY shows up in the plan.
+Needs the indexes from migrations/add_kpi_indexes.py and add_kpi_join_indexes.py.
+
+Run with: ./venv/bin/python scripts/check_query_plans.py [--days 30]
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import app
+
+LARGE_TABLES = {'orders', 'order_items', 'o', 'oi'}
+FULL_SCAN_TYPES = {'ALL', 'index'}
+
+CHECKS = [
+    ('kpis_manager window totals', app.KPI_WINDOW_TOTALS_SQL),
+    ('kpis_manager category breakdown', app.KPI_CATEGORY_BREAKDOWN_SQL),
+]
+
+
+def plan_problems(rows):
+    problems = []
+    for row in rows:
+        select_type = (row.get('select_type') or '').upper()
+        if 'DEPENDENT' in select_type:
+            problems.append(f"{select_type} on {row.get('table')}")
+        if row.get('table') in LARGE_TABLES and row.get('type') in FULL_SCAN_TYPES:
+            problems.append(f"full scan (type={row['type']}) on {row['table']}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--days', type=int, default=30, help='window size to EXPLAIN')
+    args = parser.parse_args()
+
+    end = datetime.now()
+    params = (end - timedelta(days=args.days), end)
+
+    db = app.get_db_connection()
+    cur = db.cursor(dictionary=True)
+    failed = False
+    print("=" * 70)
+    print(f"Query plan check ({app.DB_NAME}, {args.days}-day window)")
+    print("=" * 70)
+    try:
+        for name, sql in CHECKS:
+            cur.execute("EXPLAIN " + sql, params)
+            rows = cur.fetchall()
+            problems = plan_problems(rows)
+            print(f"\n{'✗' if problems else '✓'} {name}")
+            for row in rows:
+                print(f"    {str(row.get('select_type')):<18} {str(row.get('table')):<6} "
+                      f"type={str(row.get('type')):<7} key={row.get('key')} rows={row.get('rows')} "
+                      f"extra={row.get('Extra')}")
+            for problem in problems:
+                print(f"  ✗ {problem}")
+            failed = failed or bool(problems)
+    finally:
+        cur.close()
+        db.close()
+
+    if failed:
+        print("\n❌ Query plan regression detected")
+        sys.exit(1)
+    print("\n✅ All KPI query plans use index access")
+
+
+if __name__ == '__main__':
+    main()
@@ -10,9 +10,20 @@ bind = "127.0.0.1:5000"
 backlog = 2048
 
 # Worker processes
+# Socket.IO keeps room membership per worker: with more than one worker set
+# SOCKETIO_MESSAGE_QUEUE (e.g. redis://127.0.0.1:6379/0) so broadcasts reach
+# dashboards attached to every worker. Long-polling clients also need every
+# request of a session to reach the same worker, which gunicorn cannot do for
+# workers sharing one port; run one instance per port (BIND=127.0.0.1:500N)
+# behind the ip_hash upstream in nginx.conf instead of raising WORKERS.
+bind = os.getenv('BIND', bind)
 workers = int(os.getenv('WORKERS', multiprocessing.cpu_count() * 2 + 1))
-worker_class = os.getenv('WORKER_CLASS', 'sync')
-worker_connections = 1000
+# ASYNC_MODE=gevent|eventlet (see app.py) serves each WebSocket as a green thread,
+# up to worker_connections per worker; 'sync' holds a whole worker per socket.
+# Needs `pip install gevent` (or eventlet) and ASYNC_MODE set in the process environment.
+ASYNC_MODE = os.getenv('ASYNC_MODE', 'threading')
+worker_class = os.getenv('WORKER_CLASS', {'gevent': 'gevent', 'eventlet': 'eventlet'}.get(ASYNC_MODE, 'sync'))
+worker_connections = int(os.getenv('WORKER_CONNECTIONS', 1000))
 max_requests = 1000
 max_requests_jitter = 50
 timeout = int(os.getenv('WORKER_TIMEOUT', 60))
@@ -42,3 +53,18 @@ secure_scheme_headers = {
     'X-FORWARDED_PROTO': 'https',
     'X-FORWARDED_SSL': 'on',
 }
+
+
+def on_starting(server):
+    if workers > 1 and not os.getenv('SOCKETIO_MESSAGE_QUEUE'):
+        server.log.warning(
+            "%d workers without SOCKETIO_MESSAGE_QUEUE: dashboard broadcasts only "
+            "reach clients on the worker that emitted them", workers)
+
+
+def post_worker_init(worker):
+    # Background loops that must run in every worker, not just once a request
+    # happens to start them: the stock ledger consumer applies movements queued
+    # before a restart or by other workers.
+    from app import inventory_ledger
+    inventory_ledger.start()
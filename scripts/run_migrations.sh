@@ -59,7 +59,7 @@ if [[ $DO_BACKUP -eq 1 ]]; then
 fi
 
 # Run migrations in order (idempotent scripts included in migrations/)
-MIGRATIONS=("migrations/add_customer_fields.py" "migrations/upgrade_schema.py" "migrations/fix_order_items_price.py" "migrations/fix_order_status.py")
+MIGRATIONS=("migrations/add_customer_fields.py" "migrations/upgrade_schema.py" "migrations/fix_order_items_price.py" "migrations/fix_order_status.py" "migrations/add_order_updated_at.py" "migrations/add_order_indexes.py" "migrations/add_metrics_rollups.py" "migrations/add_kpi_indexes.py" "migrations/add_kpi_join_indexes.py" "migrations/add_idempotency_keys.py" "migrations/add_inventory_ledger.py" "migrations/add_recipes.py")
 
 for m in "${MIGRATIONS[@]}"; do
   if [[ -f "$ROOT_DIR/$m" ]]; then
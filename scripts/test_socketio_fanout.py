@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Integration Test: new_order fan-out across two app workers through the Socket.IO message queue
+
+Starts two app processes on their own ports sharing SOCKETIO_MESSAGE_QUEUE,
+attaches chief and receptionist dashboards to each, posts public orders to
+both workers in turn and checks that every dashboard saw every new_order.
+
+Needs MySQL (like test_end_to_end.py) and the Socket.IO client:
+    pip install "python-socketio[client]"
+Run with: ./venv/bin/python scripts/test_socketio_fanout.py [--queue redis://127.0.0.1:6379/0]
+The default queue is a file-backed one in a temp directory, so no Redis is required.
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+import socketio
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+PORTS = (8091, 8092)
+ROOMS = ('chief', 'receptionist')
+
+WORKER = "from app import app, socketio; import os; socketio.run(app, host='127.0.0.1', port=int(os.environ['PORT']), allow_unsafe_werkzeug=True)"
+
+
+def http(method, url, payload=None):
+    data = json.dumps(payload).encode() if payload is not None else None
+    req = urllib.request.Request(url, data=data, method=method, headers={'Content-Type': 'application/json'})
+    with urllib.request.urlopen(req, timeout=10) as resp:
+        return json.loads(resp.read() or b'null')
+
+
+def start_workers(queue):
+    workers = []
+    for port in PORTS:
+        env = dict(os.environ, PORT=str(port), SOCKETIO_MESSAGE_QUEUE=queue, LOG_FILE=os.devnull)
+        workers.append(subprocess.Popen([sys.executable, '-c', WORKER], cwd=ROOT, env=env, start_new_session=True))
+    deadline = time.time() + 30
+    for port in PORTS:
+        while True:
+            try:
+                http('GET', f'http://127.0.0.1:{port}/api/public/items')
+                break
+            except Exception:
+                if time.time() > deadline:
+                    raise RuntimeError(f'worker on port {port} did not come up')
+                time.sleep(0.5)
+    return workers
+
+
+def stop_workers(workers):
+    for proc in workers:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+    for proc in workers:
+        proc.wait(timeout=10)
+
+
+def attach_dashboards():
+    """One client per (worker, room); returns [(label, client, received order ids)]."""
+    dashboards = []
+    for port in PORTS:
+        for room in ROOMS:
+            client = socketio.Client(reconnection=False)
+            received = []
+            client.on('new_order', lambda data, received=received: received.append(data['order_id']))
+            client.connect(f'http://127.0.0.1:{port}', wait_timeout=10)
+            client.emit('join_dashboard', {'dashboard': room})
+            dashboards.append((f'{room}@{port}', client, received))
+    time.sleep(1)  # let join_dashboard land before the first order
+    return dashboards
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--queue', help='SOCKETIO_MESSAGE_QUEUE to test (default: file queue in a temp dir)')
+    parser.add_argument('--orders', type=int, default=6, help='orders to post, alternating between workers')
+    args = parser.parse_args()
+
+    queue = args.queue or 'file://' + os.path.join(tempfile.mkdtemp(prefix='chaa-sio-'), 'socketio.queue')
+    print("=" * 70)
+    print(f"Socket.IO fan-out test: {len(PORTS)} workers via {queue}")
+    print("=" * 70)
+
+    workers = start_workers(queue)
+    dashboards = []
+    try:
+        items = http('GET', f'http://127.0.0.1:{PORTS[0]}/api/public/items')
+        item = items[0]
+        dashboards = attach_dashboards()
+
+        posted = []
+        for i in range(args.orders):
+            port = PORTS[i % len(PORTS)]
+            order = http('POST', f'http://127.0.0.1:{port}/api/public/orders', {
+                'customer_name': f'Fan-out Test {i}',
+                'type': 'takeaway',
+                'items': [{'item_id': item['id'], 'qty': 1}],
+                'total_amount': item['price'],
+            })
+            posted.append(order['order_id'])
+            print(f"✓ Order #{order['order_id']} posted to worker :{port}")
+
+        time.sleep(2)
+        failed = False
+        for label, _, received in dashboards:
+            missing = [o for o in posted if o not in received]
+            dupes = len(received) - len(set(received))
+            ok = not missing and not dupes
+            failed = failed or not ok
+            print(f"{'✓' if ok else '✗'} {label:<20} received {len(received)}/{len(posted)}"
+                  + (f" missing={missing}" if missing else '') + (f" duplicates={dupes}" if dupes else ''))
+    finally:
+        for _, client, _ in dashboards:
+            client.disconnect()
+        stop_workers(workers)
+
+    if failed:
+        print("\n❌ Some dashboards missed orders")
+        sys.exit(1)
+    print("\n✅ Every dashboard received every new_order")
+
+
+if __name__ == '__main__':
+    main()
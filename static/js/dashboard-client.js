@@ -10,7 +10,13 @@ class DashboardClient {
     this.connected = false;
     this.listeners = {};
     this.reconnectAttempts = 0;
-    this.maxReconnectAttempts = 5;
+    // Keep retrying: missed events are replayed on rejoin (see joinDashboard)
+    this.maxReconnectAttempts = Infinity;
+    // seq of the last broadcast received, sent back on rejoin to resume from there
+    this.lastSeq = null;
+    // recently seen seqs: an event can arrive both live and in a rejoin replay
+    this.seenSeqs = new Set();
+    this.seenOrder = [];
     this.reconnectDelay = 3000;
     this.init();
   }
@@ -53,42 +59,71 @@ class DashboardClient {
     });
 
     this.socket.on('dashboard_joined', (data) => {
-      console.log(`Joined dashboard: ${data.dashboard}`);
+      console.log(`Joined dashboard: ${data.dashboard} (replayed ${data.replayed || 0})`);
+      if (data.resync || this.lastSeq === null) {
+        this.lastSeq = data.last_seq ?? this.lastSeq;
+      }
       this.emit('dashboard_joined', data);
+      // The server no longer has what we missed: reload from the REST endpoints
+      if (data.resync) this.emit('resync', data);
+    });
+
+    // The room is at its admission limit: hang up instead of holding a socket
+    // that receives nothing; pages keep their polling fallback.
+    this.socket.on('join_rejected', (data) => {
+      console.warn(`Dashboard ${data.dashboard} refused: ${data.reason}`);
+      this.socket.disconnect();
+      this.emit('join_rejected', data);
     });
 
     // Order events
     this.socket.on('new_order', (data) => {
       console.log('New order:', data);
+      if (!this.track(data)) return;
       this.emit('new_order', data);
     });
 
     this.socket.on('order_updated', (data) => {
       console.log('Order updated:', data);
+      if (!this.track(data)) return;
       this.emit('order_updated', data);
     });
 
     this.socket.on('order_status_changed', (data) => {
       console.log('Order status changed:', data);
+      if (!this.track(data)) return;
       this.emit('order_status_changed', data);
     });
 
     // Inventory events
     this.socket.on('inventory_updated', (data) => {
       console.log('Inventory updated:', data);
+      if (!this.track(data)) return;
       this.emit('inventory_updated', data);
     });
 
     // KPI events
     this.socket.on('kpi_updated', (data) => {
       console.log('KPI updated:', data);
+      if (!this.track(data)) return;
       this.emit('kpi_updated', data);
     });
   }
 
+  // Returns false for an event already delivered (same seq), which callers drop
+  track(data) {
+    if (!data || data.seq == null) return true;
+    if (this.seenSeqs.has(data.seq)) return false;
+    this.seenSeqs.add(data.seq);
+    this.seenOrder.push(data.seq);
+    if (this.seenOrder.length > 512) this.seenSeqs.delete(this.seenOrder.shift());
+    this.lastSeq = data.seq;
+    return true;
+  }
+
   joinDashboard() {
     if (!this.socket) return;
-    this.socket.emit('join_dashboard', { dashboard: this.dashboardType });
+    this.socket.emit('join_dashboard', { dashboard: this.dashboardType, last_seq: this.lastSeq });
   }
 
   leaveDashboard() {
@@ -121,6 +156,79 @@ class DashboardClient {
   }
 }
 
+/**
+ * Incremental order list for dashboards.
+ * Loads /api/orders once, then polls /api/orders/changes with the returned
+ * cursor and merges only the orders that changed (304 = nothing new).
+ */
+class OrderFeed {
+  constructor(limit = 100) {
+    this.limit = limit;
+    this.cursor = null;
+    this.byId = new Map();
+    this.orders = [];
+  }
+
+  // Returns true when `this.orders` changed since the previous call
+  async sync() {
+    if (!this.cursor) return this.reload();
+
+    let changed = false;
+    let hasMore = true;
+    while (hasMore) {
+      const response = await fetch(`/api/orders/changes?cursor=${encodeURIComponent(this.cursor)}`);
+      if (response.status === 304) break;
+      if (!response.ok) return this.reload();
+      const data = await response.json();
+      (data.orders || []).forEach(order => this.byId.set(order.id, order));
+      this.cursor = data.cursor;
+      hasMore = Boolean(data.has_more);
+      changed = true;
+    }
+    if (changed) this.rebuild();
+    return changed;
+  }
+
+  async reload() {
+    const response = await fetch('/api/orders');
+    if (!response.ok) throw new Error(`HTTP ${response.status}`);
+    const data = await response.json();
+    this.byId = new Map((data.orders || []).map(order => [order.id, order]));
+    // cursor is null when the server has no delta support; keep full reloads then
+    this.cursor = data.cursor || null;
+    this.rebuild();
+    return true;
+  }
+
+  rebuild() {
+    const sorted = [...this.byId.values()].sort((a, b) =>
+      new Date(b.created_at) - new Date(a.created_at) || b.id - a.id);
+    this.orders = sorted.slice(0, this.limit);
+    this.byId = new Map(this.orders.map(order => [order.id, order]));
+  }
+}
+
+/**
+ * Refresh an order list whenever the server broadcasts (or replays) an order
+ * event to this dashboard, and when a rejoin could not be replayed. A slow
+ * poll stays as a safety net for a dead socket.
+ */
+function followOrders(client, refresh, fallbackMs = 60000) {
+  // Bursts of events fold into one follow-up refresh instead of overlapping syncs
+  let running = null;
+  let again = false;
+  const run = async () => {
+    if (running) { again = true; return; }
+    running = (async () => {
+      do { again = false; await refresh(); } while (again);
+    })();
+    try { await running; } finally { running = null; }
+  };
+  ['new_order', 'order_updated', 'order_status_changed', 'resync'].forEach(event => client.on(event, run));
+  run();
+  return setInterval(run, fallbackMs);
+}
+
 /**
  * Utility functions for dashboards
  */
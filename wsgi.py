@@ -1,5 +1,17 @@
 # ...existing code...
 import os
+
+# Green-thread mode (ASYNC_MODE=gevent|eventlet) must patch the stdlib before
+# anything else imports socket/threading; set ASYNC_MODE in the process
+# environment (systemd unit, docker env), not only in .env.
+ASYNC_MODE = os.getenv('ASYNC_MODE', 'threading')
+if ASYNC_MODE == 'gevent':
+    from gevent import monkey
+    monkey.patch_all()
+elif ASYNC_MODE == 'eventlet':
+    import eventlet
+    eventlet.monkey_patch()
+
 import sys
 from pathlib import Path
 
@@ -17,6 +29,9 @@ if env_path.exists():
 # If your Flask object is named differently, change the import below.
 from app import app as application
 
+# gunicorn entry point used by chaa-choo.service and the Dockerfile (wsgi:app)
+app = application
+
 # ensure production defaults
 application.config.setdefault('ENV', 'production')
 application.config.setdefault('DEBUG', False)